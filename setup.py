@@ -24,5 +24,9 @@ setuptools.setup(
         'emoji==2.14.1',
         'stanza==1.10.1'
     ],
+    extras_require={
+        'nupunkt': ['nupunkt'],
+        're2': ['google-re2'],
+    },
     keywords='realtime, text streaming, stream, sentence, sentence detection, sentence generation, tts, speech synthesis, nltk, text analysis, audio processing, boundary detection, sentence boundary detection'
 )
\ No newline at end of file
@@ -3,35 +3,93 @@ Real-time processing and delivery of sentences
 from a continuous stream of characters or text chunks
 """
 
-import collections
-import functools
 import logging
+import math
 import re
 import time
 from typing import (
     AsyncIterable,
     AsyncIterator,
-    Awaitable,
-    Callable,
-    Concatenate,
     Iterable,
     Iterator,
-    ParamSpec,
 )
 
-import emoji
+try:
+    # google-re2 matches in linear time, used for the cleanup patterns
+    import re2 as cleanup_re
+except ImportError:
+    cleanup_re = re
 
 current_tokenizer = "nltk"
 stanza_initialized = False
 nltk_initialized = False
+nupunkt_initialized = False
 nlp = None
+nltk_sent_tokenize = None
+nupunkt_sent_tokenize = None
+replace_emoji = None
+
+_LINK_RE = cleanup_re.compile(
+    r"http[s]?://(?:[a-zA-Z0-9$-_@.&+!*(),]|(?:%[0-9a-fA-F]{2}))+"
+)
+
+# Code points that start an emoji (generated from the emoji package data),
+# other pictographs and symbols like mahjong tiles or ✓ stay in the text
+_EMOJI_CHARS = (
+    "\u203C\u2049\u2122\u2139\u2194-\u2199\u21A9-\u21AA\u231A-\u231B"
+    "\u2328\u23CF\u23E9-\u23F3\u23F8-\u23FA\u24C2\u25AA-\u25AB\u25B6"
+    "\u25C0\u25FB-\u25FE\u2600-\u2604\u260E\u2611\u2614-\u2615\u2618"
+    "\u261D\u2620\u2622-\u2623\u2626\u262A\u262E-\u262F\u2638-\u263A"
+    "\u2640\u2642\u2648-\u2653\u265F-\u2660\u2663\u2665-\u2666\u2668"
+    "\u267B\u267E-\u267F\u2692-\u2697\u2699\u269B-\u269C\u26A0-\u26A1"
+    "\u26A7\u26AA-\u26AB\u26B0-\u26B1\u26BD-\u26BE\u26C4-\u26C5\u26C8"
+    "\u26CE-\u26CF\u26D1\u26D3-\u26D4\u26E9-\u26EA\u26F0-\u26F5"
+    "\u26F7-\u26FA\u26FD\u2702\u2705\u2708-\u270D\u270F\u2712\u2714\u2716"
+    "\u271D\u2721\u2728\u2733-\u2734\u2744\u2747\u274C\u274E\u2753-\u2755"
+    "\u2757\u2763-\u2764\u2795-\u2797\u27A1\u27B0\u27BF\u2934-\u2935"
+    "\u2B05-\u2B07\u2B1B-\u2B1C\u2B50\u2B55\u3030\u303D\u3297\u3299"
+    "\U0001F004\U0001F0CF\U0001F170-\U0001F171\U0001F17E-\U0001F17F"
+    "\U0001F18E\U0001F191-\U0001F19A\U0001F1E6-\U0001F1FF"
+    "\U0001F201-\U0001F202\U0001F21A\U0001F22F\U0001F232-\U0001F23A"
+    "\U0001F250-\U0001F251\U0001F300-\U0001F321\U0001F324-\U0001F393"
+    "\U0001F396-\U0001F397\U0001F399-\U0001F39B\U0001F39E-\U0001F3F0"
+    "\U0001F3F3-\U0001F3F5\U0001F3F7-\U0001F4FD\U0001F4FF-\U0001F53D"
+    "\U0001F549-\U0001F54E\U0001F550-\U0001F567\U0001F56F-\U0001F570"
+    "\U0001F573-\U0001F57A\U0001F587\U0001F58A-\U0001F58D\U0001F590"
+    "\U0001F595-\U0001F596\U0001F5A4-\U0001F5A5\U0001F5A8"
+    "\U0001F5B1-\U0001F5B2\U0001F5BC\U0001F5C2-\U0001F5C4"
+    "\U0001F5D1-\U0001F5D3\U0001F5DC-\U0001F5DE\U0001F5E1\U0001F5E3"
+    "\U0001F5E8\U0001F5EF\U0001F5F3\U0001F5FA-\U0001F64F"
+    "\U0001F680-\U0001F6C5\U0001F6CB-\U0001F6D2\U0001F6D5-\U0001F6D7"
+    "\U0001F6DC-\U0001F6E5\U0001F6E9\U0001F6EB-\U0001F6EC\U0001F6F0"
+    "\U0001F6F3-\U0001F6FC\U0001F7E0-\U0001F7EB\U0001F7F0"
+    "\U0001F90C-\U0001F93A\U0001F93C-\U0001F945\U0001F947-\U0001F9FF"
+    "\U0001FA70-\U0001FA7C\U0001FA80-\U0001FA89\U0001FA8F-\U0001FAC6"
+    "\U0001FACE-\U0001FADC\U0001FADF-\U0001FAE9\U0001FAF0-\U0001FAF8"
+)
+
+_EMOJI_RE = cleanup_re.compile(
+    # keycaps like 1️⃣
+    "[#*0-9]\uFE0F?\u20E3"
+    # © and ® only in their emoji presentation
+    "|[\u00A9\u00AE]\uFE0F"
+    # single emoji, modifiers, zero width joiner and tag sequences
+    f"|[{_EMOJI_CHARS}][{_EMOJI_CHARS}\uFE0F\u200D\U000E0020-\U000E007F]*"
+)
+
+# The Punkt tokenizers only ever place a sentence boundary right after one of
+# these characters (nupunkt also splits after an ellipsis)
+_SENTENCE_END_CHARS = {
+    "nltk": frozenset(".?!"),
+    "nupunkt": frozenset(".?!…"),
+}
 
 
 def initialize_nltk(debug=False):
     """
     Initializes NLTK by downloading required data for sentence tokenization.
     """
-    global nltk_initialized
+    global nltk_initialized, nltk_sent_tokenize
     if nltk_initialized:
         return
 
@@ -40,6 +98,7 @@ def initialize_nltk(debug=False):
     try:
         import nltk
 
+        nltk_sent_tokenize = nltk.tokenize.sent_tokenize
         nltk.download("punkt_tab", quiet=not debug)
         nltk_initialized = True
     except Exception as e:
@@ -70,6 +129,27 @@ def initialize_stanza(language: str = "en", offline=False):
         stanza_initialized = False
 
 
+def initialize_nupunkt():
+    """
+    Initializes nupunkt, a dependency free Punkt implementation that ships
+    with its pretrained model.
+    """
+    global nupunkt_initialized, nupunkt_sent_tokenize
+    if nupunkt_initialized:
+        return
+
+    logging.info("Initializing nupunkt Tokenizer")
+
+    try:
+        from nupunkt import sent_tokenize
+
+        nupunkt_sent_tokenize = sent_tokenize
+        nupunkt_initialized = True
+    except Exception as e:
+        print(f"Error initializing nupunkt tokenizer: {e}")
+        nupunkt_initialized = False
+
+
 def _remove_links(text: str) -> str:
     """
     Removes any links from the input text.
@@ -80,44 +160,39 @@ def _remove_links(text: str) -> str:
     Returns:
         str: Text with links removed
     """
-    pattern = (
-        r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|"
-        r"[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
-    )
+    return _LINK_RE.sub("", text)
 
-    return re.sub(pattern, "", text)
 
-
-def _remove_emojis(text: str) -> str:
+def _remove_emojis(text: str, strict_emoji: bool = False) -> str:
     """
     Removes emojis from the input text.
 
     Args:
         text (str): Input text
+        strict_emoji (bool, optional): Use the emoji package for exact
+          coverage instead of the faster unicode range regex.
 
     Returns:
         str: Text with emojis removed
     """
-    return emoji.replace_emoji(text, "")
+    if strict_emoji:
+        global replace_emoji
+        if replace_emoji is None:
+            import emoji
 
+            replace_emoji = emoji.replace_emoji
+        return replace_emoji(text, "")
+    return _EMOJI_RE.sub("", text)
 
-def _generate_characters_from_chunk(
-    chunk: str, log_characters: bool = False
-) -> Iterator[str]:
+
+def _debug_print(message: str):
     """
-    Generates individual characters from a text.
+    Prints a debug message highlighted in cyan.
 
     Args:
-        chunk (str): Input text
-        log_characters (bool): Whether to log the characters to the console
-
-    Yields:
-        Individual characters from the text
+        message (str): Message to print
     """
-    for char in chunk:
-        if log_characters:
-            print(char, end="", flush=True)
-        yield char
+    print(f"\033[36m{message}\033[0m")
 
 
 def _clean_text(
@@ -125,6 +200,7 @@ def _clean_text(
     cleanup_text_links: bool = False,
     cleanup_text_emojis: bool = False,
     strip_text: bool = True,
+    strict_emoji: bool = False,
 ) -> str:
     """
     Cleans the text by removing links and emojis.
@@ -135,6 +211,10 @@ def _clean_text(
           the stream.
         cleanup_text_emojis (boolean, optional): Remove non-desired emojis
           from the stream.
+        strip_text (boolean, optional): Remove leading and trailing
+          whitespace.
+        strict_emoji (boolean, optional): Use the emoji package to detect
+          emojis.
 
     Returns:
         str: Cleaned text
@@ -142,8 +222,9 @@ def _clean_text(
     if cleanup_text_links:
         text = _remove_links(text)
     if cleanup_text_emojis:
-        text = _remove_emojis(text)
-    if strip_text:
+        text = _remove_emojis(text, strict_emoji)
+    # Sentences from the tokenizers are mostly stripped already
+    if strip_text and text and (text[0].isspace() or text[-1].isspace()):
         text = text.strip()
     return text
 
@@ -165,13 +246,15 @@ def _tokenize_sentences(text: str, tokenize_sentences=None) -> list[str]:
     else:
         nlp_start_time = time.time()
         if current_tokenizer == "nltk":
-            import nltk
-
-            sentences = nltk.tokenize.sent_tokenize(text)
+            sentences = nltk_sent_tokenize(text)
+        elif current_tokenizer == "nupunkt":
+            if nupunkt_sent_tokenize is None:
+                raise ImportError(
+                    "nupunkt is not installed, "
+                    "install it with: pip install stream2sentence[nupunkt]"
+                )
+            sentences = nupunkt_sent_tokenize(text)
         elif current_tokenizer == "stanza":
-            import stanza
-
-            global nlp
             doc = nlp(text)
             sentences = [sentence.text for sentence in doc.sentences]
         else:
@@ -189,6 +272,8 @@ def init_tokenizer(tokenizer: str, language: str = "en", offline=False, debug=Fa
         initialize_nltk(debug)
     elif tokenizer == "stanza":
         initialize_stanza(language, offline=offline)
+    elif tokenizer == "nupunkt":
+        initialize_nupunkt()
     else:
         logging.warning(f"Unknown tokenizer: {tokenizer}")
 
@@ -213,6 +298,7 @@ async def generate_sentences_async(
     force_first_fragment_after_words=30,
     filter_first_non_alnum_characters: bool = False,
     debug=False,
+    strict_emoji: bool = False,
 ) -> AsyncIterator[str]:
     """
     Generates well-formed sentences from a stream of characters or text chunks
@@ -254,7 +340,7 @@ async def generate_sentences_async(
         tokenize_sentences (Callable): A function that tokenizes sentences
           from the input text. Defaults to None.
         tokenizer (str): The tokenizer to use for sentence tokenization.
-          Default is "nltk". Can be "nltk" or "stanza".
+          Default is "nltk". Can be "nltk", "stanza" or "nupunkt".
         language (str): The language to use for sentence tokenization.
           Default is "en". Can be "multilingual" for stanze tokenizer.
         log_characters (bool): If True, logs each character to the console as
@@ -269,6 +355,8 @@ async def generate_sentences_async(
         filter_first_non_alnum_characters (bool): If True, filters out the
           first non-alphanumeric characters from the text stream.
         debug (bool): If True, enables debug mode for logging.
+        strict_emoji (bool): If True, emojis are detected with the emoji
+          package (exact, but slower) instead of unicode emoji ranges.
 
     Yields:
         Iterator[str]: An iterator of complete sentences constructed from the
@@ -301,6 +389,7 @@ async def generate_sentences_async(
         force_first_fragment_after_words=force_first_fragment_after_words,
         filter_first_non_alnum_characters=filter_first_non_alnum_characters,
         debug=debug,
+        strict_emoji=strict_emoji,
     )
 
     if log_characters:
@@ -318,43 +407,131 @@ async def generate_sentences_async(
         yield sentence
 
 
-def _await_sync(f: Awaitable[str]) -> str:
-    gen = f.__await__()
-    try:
-        next(gen)
-        raise RuntimeError(f"{f} failed to be synchronous")
-    except StopIteration as e:
-        return e.value
-
-
-def _async_iter_to_sync(f: AsyncIterator[str]) -> Iterator[str]:
-    try:
-        while True:
-            yield _await_sync(f.__anext__())
-    except StopAsyncIteration:
-        return
-
+def generate_sentences(
+    generator: Iterable[str],
+    context_size: int = 12,
+    context_size_look_overhead: int = 12,
+    minimum_sentence_length: int = 10,
+    minimum_first_fragment_length=10,
+    quick_yield_single_sentence_fragment: bool = False,
+    quick_yield_for_all_sentences: bool = False,
+    quick_yield_every_fragment: bool = False,
+    cleanup_text_links: bool = False,
+    cleanup_text_emojis: bool = False,
+    tokenize_sentences=None,
+    tokenizer: str = "nltk",
+    language: str = "en",
+    log_characters: bool = False,
+    sentence_fragment_delimiters: str = ".?!;:,\n…)]}。-",
+    full_sentence_delimiters: str = ".?!\n…。",
+    force_first_fragment_after_words=30,
+    filter_first_non_alnum_characters: bool = False,
+    debug=False,
+    strict_emoji: bool = False,
+) -> Iterator[str]:
+    """
+    Generates well-formed sentences from a stream of characters or text chunks
+      provided by a synchronous input generator.
 
-P = ParamSpec("P")
+    Args:
+        generator (Iterable[str]): A generator that yields chunks of text as a
+          stream of characters.
+        context_size (int): The number of characters used to establish context
+          for sentence boundary detection. A larger context improves the
+          accuracy of detecting sentence boundaries.
+          Default is 12 characters.
+        context_size_look_overhead: The number of characters to look
+          over the context_size boundaries to detect sentence splitting
+          characters (improves sentence detection).
+        minimum_sentence_length (int): The minimum number of characters a
+          sentence must have. If a sentence is shorter, it will be
+          concatenated with the following one, improving the overall
+          readability. This parameter does not apply to the first sentence
+          fragment, which is governed by `minimum_first_fragment_length`.
+          Default is 10 characters.
+        minimum_first_fragment_length (int): The minimum number of characters
+          required for the first sentence fragment before yielding.
+          Default is 10 characters.
+        quick_yield_single_sentence_fragment (bool): If set to True, the
+          generator will yield the first sentence first fragment as quickly as
+          possible. This is particularly useful for real-time applications
+          such as speech synthesis.
+        quick_yield_for_all_sentences (bool): If set to True, the
+          generator will yield every sentence first fragment as quickly as
+          possible (not only the first sentence first fragment)
+        quick_yield_every_fragment (bool): If set to True, the
+          generator not only yield every sentence first fragment, but also every
+          following fragment.
+        cleanup_text_links (bool): If True, removes hyperlinks from the text
+          stream to ensure clean output.
+        cleanup_text_emojis (bool): If True, filters out emojis from the text
+          stream for clear textual content.
+        tokenize_sentences (Callable): A function that tokenizes sentences
+          from the input text. Defaults to None.
+        tokenizer (str): The tokenizer to use for sentence tokenization.
+          Default is "nltk". Can be "nltk", "stanza" or "nupunkt".
+        language (str): The language to use for sentence tokenization.
+          Default is "en". Can be "multilingual" for stanze tokenizer.
+        log_characters (bool): If True, logs each character to the console as
+          they are processed.
+        sentence_fragment_delimiters (str): A string of characters that are
+          considered sentence fragment delimiters. Default is ".?!;:,\n…)]}。-".
+        full_sentence_delimiters (str): A string of characters that are
+          considered full sentence delimiters. Default is ".?!\n…。".
+        force_first_fragment_after_words (int): The number of words after
+          which the first sentence fragment is forced to be yielded.
+          Default is 30 words.
+        filter_first_non_alnum_characters (bool): If True, filters out the
+          first non-alphanumeric characters from the text stream.
+        debug (bool): If True, enables debug mode for logging.
+        strict_emoji (bool): If True, emojis are detected with the emoji
+          package (exact, but slower) instead of unicode emoji ranges.
 
+    Yields:
+        Iterator[str]: An iterator of complete sentences constructed from the
+          input text stream. Each yielded sentence meets the specified minimum
+          length requirements and is cleaned up if specified.
 
-def _dowrap(
-    f: Callable[Concatenate[AsyncIterable[str], P], AsyncIterator[str]]
-) -> Callable[Concatenate[Iterable[str], P], Iterator[str]]:
-    @functools.wraps(f)
-    def inner(generator: Iterable[str], *args: P.args, **kwargs: P.kwargs):
-        async def gen_wrap():
-            for x in generator:
-                yield x
+    The function maintains a buffer to accumulate text chunks and applies
+      natural language processing to detect sentence boundaries.
+      It employs various heuristics, such as minimum sentence length and
+      sentence delimiters, to ensure the quality of the output sentences.
+      The function also provides options to clean up the text stream,
+      making it versatile for different types of text processing applications.
+    """
+    sentence_splitter = SentenceSplitter(
+        context_size=context_size,
+        context_size_look_overhead=context_size_look_overhead,
+        minimum_sentence_length=minimum_sentence_length,
+        minimum_first_fragment_length=minimum_first_fragment_length,
+        quick_yield_single_sentence_fragment=quick_yield_single_sentence_fragment,
+        quick_yield_for_all_sentences=quick_yield_for_all_sentences,
+        quick_yield_every_fragment=quick_yield_every_fragment,
+        cleanup_text_links=cleanup_text_links,
+        cleanup_text_emojis=cleanup_text_emojis,
+        tokenize_sentences=tokenize_sentences,
+        tokenizer=tokenizer,
+        language=language,
+        log_characters=log_characters,
+        sentence_fragment_delimiters=sentence_fragment_delimiters,
+        full_sentence_delimiters=full_sentence_delimiters,
+        force_first_fragment_after_words=force_first_fragment_after_words,
+        filter_first_non_alnum_characters=filter_first_non_alnum_characters,
+        debug=debug,
+        strict_emoji=strict_emoji,
+    )
 
-        return _async_iter_to_sync(f(gen_wrap(), *args, **kwargs))
+    if log_characters:
+        print("Stream: ", end="", flush=True)
 
-    return inner
+    for chunk in generator:
+        sentence_splitter.add(chunk)
+        yield from sentence_splitter.stream()
 
+    if log_characters:
+        print()
 
-generate_sentences = _dowrap(generate_sentences_async)
-generate_sentences.__name__ = "generate_sentences"
-generate_sentences.__qualname__ = "generate_sentences"
+    yield from sentence_splitter.flush()
 
 
 class SentenceSplitter:
@@ -378,6 +555,7 @@ class SentenceSplitter:
         force_first_fragment_after_words=30,
         filter_first_non_alnum_characters: bool = False,
         debug=False,
+        strict_emoji: bool = False,
     ):
         """
         Generates well-formed sentences from a stream of characters or text chunks
@@ -417,7 +595,7 @@ class SentenceSplitter:
             tokenize_sentences (Callable): A function that tokenizes sentences
             from the input text. Defaults to None.
             tokenizer (str): The tokenizer to use for sentence tokenization.
-            Default is "nltk". Can be "nltk" or "stanza".
+            Default is "nltk". Can be "nltk", "stanza" or "nupunkt".
             language (str): The language to use for sentence tokenization.
             Default is "en". Can be "multilingual" for stanze tokenizer.
             log_characters (bool): If True, logs each character to the console as
@@ -432,6 +610,8 @@ class SentenceSplitter:
             filter_first_non_alnum_characters (bool): If True, filters out the
             first non-alphanumeric characters from the text stream.
             debug (bool): If True, enables debug mode for logging.
+            strict_emoji (bool): If True, emojis are detected with the emoji
+            package (exact, but slower) instead of unicode emoji ranges.
 
         Yields:
             Iterator[str]: An iterator of complete sentences constructed from the
@@ -450,11 +630,12 @@ class SentenceSplitter:
         current_tokenizer = tokenizer
         init_tokenizer(current_tokenizer, language, debug)
 
-        self.input_buffer = collections.deque[str]()
+        self.input_buffer: list[str] = []
         self.buffer = ""
         self.is_first_sentence = True
         self.word_count = 0  # Initialize word count
         self.last_delimiter_position = -1  # Position of last full sentence delimiter
+        self.buffer_sentence_end_count = 0  # Places where Punkt could split
 
         # Adjust quick yield flags based on settings
         if quick_yield_every_fragment:
@@ -472,160 +653,308 @@ class SentenceSplitter:
         self.quick_yield_every_fragment = quick_yield_every_fragment
         self.cleanup_text_links = cleanup_text_links
         self.cleanup_text_emojis = cleanup_text_emojis
+        self.strict_emoji = strict_emoji
         self.tokenize_sentences = tokenize_sentences
         self.tokenizer = tokenizer
         self.language = language
         self.log_characters = log_characters
         self.sentence_fragment_delimiters = sentence_fragment_delimiters
         self.full_sentence_delimiters = full_sentence_delimiters
+        self.sentence_fragment_delimiter_set = frozenset(sentence_fragment_delimiters)
+        self.full_sentence_delimiter_set = frozenset(full_sentence_delimiters)
         self.force_first_fragment_after_words = force_first_fragment_after_words
         self.filter_first_non_alnum_characters = filter_first_non_alnum_characters
         self.debug = debug
 
+        # Punkt splits at most once per sentence end char, which lets the
+        # stream skip tokenizing whenever the result could not be yielded
+        self.skip_tokenize_without_sentence_end = (
+            tokenize_sentences is None and tokenizer in _SENTENCE_END_CHARS
+        )
+        self.sentence_end_chars = _SENTENCE_END_CHARS.get(tokenizer, frozenset())
+
+        # Characters that need individual handling while streaming
+        event_chars = "".join(
+            self.sentence_fragment_delimiter_set
+            | self.full_sentence_delimiter_set
+            | self.sentence_end_chars
+        )
+        self.event_chars_pattern = re.compile(f"[{re.escape(event_chars)}\\s]")
+
+    @property
+    def buffer(self) -> str:
+        """
+        The text accumulated for the current sentence.
+
+        Appended text is collected in parts and only joined when the buffer is
+        read, so growing it character by character stays linear.
+        """
+        if len(self._buffer_parts) > 1:
+            self._buffer_parts = ["".join(self._buffer_parts)]
+        return self._buffer_parts[0] if self._buffer_parts else ""
+
+    @buffer.setter
+    def buffer(self, value: str):
+        self._buffer_parts = [value] if value else []
+        self._buffer_length = len(value)
+
+    def _append_to_buffer(self, text: str):
+        """
+        Appends text to the buffer, dropping leading whitespace of the buffer.
+
+        Args:
+            text (str): Non-empty text to append
+        """
+        if self._buffer_parts and not self._buffer_parts[0][0].isspace():
+            self._buffer_parts.append(text)
+            self._buffer_length += len(text)
+        else:
+            self.buffer = (self.buffer + text).lstrip()
+
     def add(self, chunk: str):
         self.input_buffer.append(chunk)
 
-    def stream(self):
-        while self.input_buffer:
-            chunk = self.input_buffer.popleft()
-            for char in _generate_characters_from_chunk(chunk, self.log_characters):
-                if char:
-                    if len(self.buffer) == 0:
-                        if self.filter_first_non_alnum_characters:
-                            if not char.isalnum():
-                                continue
+    def _plain_run_end(self, chunk: str, position: int) -> int:
+        """
+        Finds the end of the run of plain characters starting at position.
 
-                    self.buffer = (self.buffer + char).lstrip()
+        Plain characters are neither whitespace nor delimiters, so appending
+        them only grows the buffer. The run is cut short where a character
+        could still cause a tokenize call or needs the first character filter.
 
-                    # Update word count on encountering space or sentence fragment delimiter
-                    if char.isspace() or char in self.sentence_fragment_delimiters:
-                        self.word_count += 1
+        Args:
+            chunk (str): The chunk being processed
+            position (int): Index of the next unprocessed character
 
-                    if self.debug:
-                        print("\033[36mDebug: Added char, buffer size: \"{}\"\033[0m".format(len(self.buffer)))
+        Returns:
+            int: End index (exclusive) of the run, equals position if empty
+        """
+        if not self._buffer_length and self.filter_first_non_alnum_characters:
+            return position
 
-                    # Check conditions to yield first sentence fragment quickly
-                    if (
-                        self.is_first_sentence
-                        and len(self.buffer) > self.minimum_first_fragment_length
-                        and self.quick_yield_single_sentence_fragment
-                    ):
+        match = self.event_chars_pattern.search(chunk, position)
+        run_end = match.start() if match else len(chunk)
 
-                        if (
-                            self.buffer[-1] in self.sentence_fragment_delimiters
-                            or char.isspace() and self.word_count >= self.force_first_fragment_after_words
-                        ):
+        min_length, max_length = self._tokenize_lengths()
+        if self._buffer_length >= max_length:
+            return run_end
+
+        # Stop before the first length that leads to a tokenize call
+        room = max(
+            self.minimum_sentence_length + self.context_size, min_length - 1
+        ) - self._buffer_length
+        return min(run_end, position + max(room, 0))
+
+    def _tokenize_lengths(self) -> tuple[int, float]:
+        """
+        Returns the range of buffer lengths at which tokenizing could yield.
+
+        Yielding needs more than two sentences, or at least two sentences
+        with the last full sentence delimiter inside the context window.
+        Punkt splits at most once per sentence end char, so with fewer than
+        two of them in the buffer only the context window lengths count.
 
-                            yield_text = _clean_text(
-                                self.buffer,
-                                self.cleanup_text_links,
-                                self.cleanup_text_emojis)
-                            if self.debug:
-                                if self.buffer[-1] in self.sentence_fragment_delimiters:
-                                    print("\033[36mDebug: Yielding first sentence fragment: \"{}\" because buffer[-1] {} is sentence frag \033[0m".format(yield_text, self.buffer[-1]))
-                                else:
-                                    print("\033[36mDebug: Yielding first sentence fragment: \"{}\" because word_count {} is >= force_first_fragment_after_words \033[0m".format(yield_text, self.word_count))
+        Returns:
+            tuple[int, float]: Inclusive minimum and maximum buffer length,
+              an empty range if tokenizing cannot yield at all
+        """
+        # current_tokenizer is shared, a splitter created later may have
+        # switched it to a tokenizer with other sentence end chars
+        if (
+            not self.skip_tokenize_without_sentence_end
+            or self.tokenizer != current_tokenizer
+            or self.buffer_sentence_end_count >= 2
+        ):
+            return 0, math.inf
+
+        if self.buffer_sentence_end_count == 0 or self.last_delimiter_position < 0:
+            return 1, 0
+
+        window_start_length = self.last_delimiter_position + self.context_size + 1
+        return (
+            window_start_length,
+            window_start_length + self.context_size_look_overhead,
+        )
 
-                            yield yield_text
+    def stream(self):
+        while self.input_buffer:
+            # Process everything added so far as a single string
+            chunk = "".join(self.input_buffer)
+            self.input_buffer.clear()
+            if self.log_characters:
+                print(chunk, end="", flush=True)
+
+            position = 0
+            while position < len(chunk):
+                # Append runs of characters that cannot trigger any event at once
+                run_end = self._plain_run_end(chunk, position)
+                if run_end > position:
+                    self._append_to_buffer(chunk[position:run_end])
+                    position = run_end
 
-                            self.buffer = ""
-                            self.word_count = 0
-                            if not self.quick_yield_every_fragment:
-                                self.is_first_sentence = False
+                    if self.debug:
+                        _debug_print("Debug: Added chars, buffer size: \"{}\"".format(self._buffer_length))
 
+                    continue
+
+                char = chunk[position]
+                position += 1
+
+                if self._buffer_length == 0:
+                    if self.filter_first_non_alnum_characters:
+                        if not char.isalnum():
                             continue
 
-                    # Continue accumulating characters if buffer is under minimum sentence length
-                    if len(self.buffer) <= self.minimum_sentence_length + self.context_size:
+                self._append_to_buffer(char)
 
-                        continue
+                if char in self.sentence_end_chars:
+                    self.buffer_sentence_end_count += 1
 
-                    # Update last delimiter position if a new delimiter is found
-                    if char in self.full_sentence_delimiters:
-                        self.last_delimiter_position = len(self.buffer) - 1
+                # Update word count on encountering space or sentence fragment delimiter.
+                # Plain character runs contain neither, so only single characters count.
+                is_space = char.isspace()
+                if is_space or char in self.sentence_fragment_delimiter_set:
+                    self.word_count += 1
 
-                    # Define context window for checking potential sentence boundaries
-                    context_window_end_pos = len(self.buffer) - self.context_size - 1
-                    context_window_start_pos = (
-                        context_window_end_pos - self.context_size_look_overhead
-                    )
-                    if context_window_start_pos < 0:
-                        context_window_start_pos = 0
+                if self.debug:
+                    _debug_print("Debug: Added char, buffer size: \"{}\"".format(self._buffer_length))
 
-                    # Tokenize sentences from buffer
-                    sentences = _tokenize_sentences(self.buffer, self.tokenize_sentences)
+                # Check conditions to yield first sentence fragment quickly
+                if (
+                    self.is_first_sentence
+                    and self._buffer_length > self.minimum_first_fragment_length
+                    and self.quick_yield_single_sentence_fragment
+                ):
 
-                    if self.debug:
-                        print("\033[36mbuffer: \"{}\"\033[0m".format(self.buffer))
-                        print("\033[36mlast_delimiter_position: {}\033[0m".format(self.last_delimiter_position))
-                        print("\033[36mlen(sentences) > 2: {}\033[0m".format(len(sentences) > 2))
-                        print("\033[36mcontext_window_start_pos: {}\033[0m".format(context_window_start_pos))
-                        print("\033[36mcontext_window_end_pos: {}\033[0m".format(context_window_end_pos))
-
-                    # Combine sentences below minimum_sentence_length with the next sentence(s)
-                    combined_sentences = []
-                    temp_sentence = ""
-
-                    for sentence in sentences:
-                        if len(sentence) < self.minimum_sentence_length:
-                            temp_sentence += sentence + " "
-                        else:
-                            if temp_sentence:
-                                temp_sentence += sentence
-                                combined_sentences.append(temp_sentence.strip())
-                                temp_sentence = ""
+                    # The buffer is not empty here, so it ends with char
+                    if (
+                        char in self.sentence_fragment_delimiter_set
+                        or is_space and self.word_count >= self.force_first_fragment_after_words
+                    ):
+
+                        yield_text = _clean_text(
+                            self.buffer,
+                            self.cleanup_text_links,
+                            self.cleanup_text_emojis,
+                            strict_emoji=self.strict_emoji)
+                        if self.debug:
+                            if char in self.sentence_fragment_delimiter_set:
+                                _debug_print("Debug: Yielding first sentence fragment: \"{}\" because buffer[-1] {} is sentence frag".format(yield_text, char))
                             else:
-                                combined_sentences.append(sentence.strip())
+                                _debug_print("Debug: Yielding first sentence fragment: \"{}\" because word_count {} is >= force_first_fragment_after_words".format(yield_text, self.word_count))
 
-                    # If there's a leftover temp_sentence that hasn't been appended
-                    if temp_sentence:
-                        combined_sentences.append(temp_sentence.strip())
+                        yield yield_text
 
-                    # Replace the original sentences with the combined_sentences
-                    sentences = combined_sentences
+                        self.buffer = ""
+                        self.buffer_sentence_end_count = 0
+                        self.word_count = 0
+                        if not self.quick_yield_every_fragment:
+                            self.is_first_sentence = False
 
-                    # Process and yield sentences based on conditions
-                    if len(sentences) > 2 or (
-                        self.last_delimiter_position >= 0
-                        and context_window_start_pos
-                        <= self.last_delimiter_position
-                        <= context_window_end_pos
-                    ):
+                        continue
 
-                        if len(sentences) > 1:
-                            total_length_except_last = sum(
-                                len(sentence) for sentence in sentences[:-1]
-                            )
-                            if total_length_except_last >= self.minimum_sentence_length:
-                                for sentence in sentences[:-1]:
-                                    yield_text = _clean_text(
-                                        sentence,
-                                        self.cleanup_text_links,
-                                        self.cleanup_text_emojis)
-                                    if self.debug:
-                                        print("\033[36mDebug: Yielding sentence: \"{}\"\033[0m".format(yield_text))
+                # Continue accumulating characters if buffer is under minimum sentence length
+                if self._buffer_length <= self.minimum_sentence_length + self.context_size:
 
-                                    yield yield_text
-                                    self.word_count = 0
+                    continue
 
-                                if self.quick_yield_for_all_sentences:
-                                    self.is_first_sentence = True
+                # Update last delimiter position if a new delimiter is found
+                if char in self.full_sentence_delimiter_set:
+                    self.last_delimiter_position = self._buffer_length - 1
 
-                                # we need to remember if the buffer ends with space
-                                # - sentences returned by the tokenizers are rtrimmed
-                                # - this takes any blank spaces away from the last unfinshed sentence
-                                # - we have to work around this by re-adding the blank space in this case
-                                ends_with_space = self.buffer.endswith(" ")
+                # Define context window for checking potential sentence boundaries
+                context_window_end_pos = self._buffer_length - self.context_size - 1
+                context_window_start_pos = (
+                    context_window_end_pos - self.context_size_look_overhead
+                )
+                if context_window_start_pos < 0:
+                    context_window_start_pos = 0
 
-                                # set buffer to last unfinshed sentence returned by tokenizers
-                                self.buffer = sentences[-1]
+                # Skip tokenizing while its result could not be yielded
+                min_length, max_length = self._tokenize_lengths()
+                if not min_length <= self._buffer_length <= max_length:
+                    continue
 
-                                # reset the blank space if it was there:
-                                if ends_with_space:
-                                    self.buffer += " "
+                # Tokenize sentences from buffer
+                sentences = _tokenize_sentences(self.buffer, self.tokenize_sentences)
 
-                                # reset the last delimiter position after yielding
-                                self.last_delimiter_position = -1 
+                if self.debug:
+                    _debug_print("buffer: \"{}\"".format(self.buffer))
+                    _debug_print("last_delimiter_position: {}".format(self.last_delimiter_position))
+                    _debug_print("len(sentences) > 2: {}".format(len(sentences) > 2))
+                    _debug_print("context_window_start_pos: {}".format(context_window_start_pos))
+                    _debug_print("context_window_end_pos: {}".format(context_window_end_pos))
+
+                # Combine sentences below minimum_sentence_length with the next sentence(s)
+                combined_sentences = []
+                short_sentences = []
+
+                for sentence in sentences:
+                    if len(sentence) < self.minimum_sentence_length:
+                        short_sentences.append(sentence)
+                    elif short_sentences:
+                        short_sentences.append(sentence)
+                        combined_sentences.append(" ".join(short_sentences).strip())
+                        short_sentences = []
+                    else:
+                        combined_sentences.append(sentence.strip())
+
+                # If there are leftover short sentences that haven't been appended
+                if short_sentences:
+                    combined_sentences.append(" ".join(short_sentences).strip())
+
+                # Replace the original sentences with the combined_sentences
+                sentences = combined_sentences
+
+                # Process and yield sentences based on conditions
+                if len(sentences) > 2 or (
+                    self.last_delimiter_position >= 0
+                    and context_window_start_pos
+                    <= self.last_delimiter_position
+                    <= context_window_end_pos
+                ):
+
+                    if len(sentences) > 1:
+                        # Combined sentences before the last one are rarely short,
+                        # so the first one alone mostly decides this check
+                        if (
+                            len(sentences[0]) >= self.minimum_sentence_length
+                            or sum(len(sentence) for sentence in sentences[:-1])
+                            >= self.minimum_sentence_length
+                        ):
+                            for sentence in sentences[:-1]:
+                                yield_text = _clean_text(
+                                    sentence,
+                                    self.cleanup_text_links,
+                                    self.cleanup_text_emojis,
+                                    strict_emoji=self.strict_emoji)
+                                if self.debug:
+                                    _debug_print("Debug: Yielding sentence: \"{}\"".format(yield_text))
+
+                                yield yield_text
+                                self.word_count = 0
+
+                            if self.quick_yield_for_all_sentences:
+                                self.is_first_sentence = True
+
+                            # we need to remember if the buffer ends with space
+                            # - sentences returned by the tokenizers are rtrimmed
+                            # - this takes any blank spaces away from the last unfinshed sentence
+                            # - we have to work around this by re-adding the blank space in this case
+                            ends_with_space = self.buffer.endswith(" ")
+
+                            # set buffer to last unfinshed sentence returned by tokenizers
+                            self.buffer = sentences[-1]
+                            self.buffer_sentence_end_count = sum(
+                                c in self.sentence_end_chars for c in self.buffer
+                            )
+
+                            # reset the blank space if it was there:
+                            if ends_with_space:
+                                self.buffer += " "
+
+                            # reset the last delimiter position after yielding
+                            self.last_delimiter_position = -1 
 
     def flush(self):
         # Yield remaining buffer as final sentence(s)
@@ -641,11 +970,14 @@ class SentenceSplitter:
                     continue
 
                 yield_text = _clean_text(
-                    sentence_buffer, self.cleanup_text_links, self.cleanup_text_emojis
+                    sentence_buffer,
+                    self.cleanup_text_links,
+                    self.cleanup_text_emojis,
+                    strict_emoji=self.strict_emoji,
                 )
 
                 if self.debug:
-                    print("\033[36mDebug: Yielding final sentence(s): \"{}\"\033[0m".format(yield_text))
+                    _debug_print("Debug: Yielding final sentence(s): \"{}\"".format(yield_text))
 
                 yield yield_text
 
@@ -655,8 +987,9 @@ class SentenceSplitter:
                 yield_text = _clean_text(
                     sentence_buffer,
                     self.cleanup_text_links,
-                    self.cleanup_text_emojis)
+                    self.cleanup_text_emojis,
+                    strict_emoji=self.strict_emoji)
                 if self.debug:
-                    print("\033[36mDebug: Yielding remaining text: \"{}\"\033[0m".format(yield_text))
+                    _debug_print("Debug: Yielding remaining text: \"{}\"".format(yield_text))
 
                 yield yield_text
@@ -1,5 +1,7 @@
+import asyncio
+import importlib.util
 import unittest
-from stream2sentence import generate_sentences, generate_sentences_async
+from stream2sentence import generate_sentences, generate_sentences_async, SentenceSplitter
 
 class TestSentenceGenerator(unittest.TestCase):
 
@@ -48,12 +50,58 @@ class TestSentenceGenerator(unittest.TestCase):
         sentences = list(generate_sentences(generator(), minimum_sentence_length = 3, context_size=5, minimum_first_fragment_length = 3, quick_yield_single_sentence_fragment=True))
         self.assertEqual(sentences, expected)    
 
+    def test_async_generator(self):
+        async def generator():
+            yield "Hallo, "
+            yield "wie geht es dir? "
+            yield "Mir geht es gut."
+        async def collect():
+            return [sentence async for sentence in generate_sentences_async(generator(), minimum_sentence_length = 3, context_size=5, minimum_first_fragment_length = 3, quick_yield_single_sentence_fragment=True)]
+        expected = ["Hallo,", "wie geht es dir?", "Mir geht es gut."]
+        sentences = asyncio.run(collect())
+        self.assertEqual(sentences, expected)    
+
     def test_return_incomplete_last(self):
         text = "How I feel? I feel fine"
         expected = ["How I feel?", "I feel fine"]
         sentences = list(generate_sentences(text))
         self.assertEqual(sentences, expected)    
 
+    def test_chunk_sizes(self):
+        text = "This is a test. This is another test sentence. Just testing out the module."
+        expected = ["This is a test.", "This is another test sentence.", "Just testing out the module."]
+        def generator(size):
+            for i in range(0, len(text), size):
+                yield text[i:i + size]
+        for size in (1, 3, 7, len(text)):
+            sentences = list(generate_sentences(generator(size)))
+            self.assertEqual(sentences, expected)
+
+    def stream_characters(self, text, **kwargs):
+        # Feeds text one character at a time and keeps the sentences yielded
+        # while streaming apart from the ones only yielded by flush()
+        splitter = SentenceSplitter(**kwargs)
+        streamed = []
+        for char in text:
+            splitter.add(char)
+            streamed.extend(splitter.stream())
+        return streamed, list(splitter.flush())
+
+    def test_stream_yields_on_more_than_two_sentences(self):
+        # No full sentence delimiters, so only the tokenizer finding more than
+        # two sentences can yield before flush
+        text = "This is the first one. This is the second one. This is the third one. And the"
+        streamed, flushed = self.stream_characters(text, full_sentence_delimiters="")
+        self.assertEqual(streamed, ["This is the first one.", "This is the second one."])
+        self.assertEqual(flushed, ["This is the third one.", "And the"])
+
+    def test_stream_yields_on_delimiter_in_context_window(self):
+        # A single sentence end yields once it is inside the context window
+        text = "This is the first sentence. And then the next one keeps going on"
+        streamed, flushed = self.stream_characters(text)
+        self.assertEqual(streamed, ["This is the first sentence."])
+        self.assertEqual(flushed, ["And then the next one keeps going on"])
+
     def test_hello_world(self):
         text = "Hello, world."
         expected = ["Hello,", "world."]
@@ -72,6 +120,34 @@ class TestSentenceGenerator(unittest.TestCase):
         sentences = list(generate_sentences(text))
         self.assertEqual(sentences, expected)
 
+    @unittest.skipUnless(importlib.util.find_spec("nupunkt"), "nupunkt is not installed")
+    def test_nupunkt(self):
+        text = "This is a test. This is another test sentence. Just testing out the module."
+        expected = ["This is a test.", "This is another test sentence.", "Just testing out the module."]
+        sentences = list(generate_sentences(text, tokenizer="nupunkt"))
+        self.assertEqual(sentences, expected)
+
+    @unittest.skipUnless(importlib.util.find_spec("nupunkt"), "nupunkt is not installed")
+    def test_nupunkt_stream_yields_on_ellipsis(self):
+        text = "He paused for a long time… Then he left the room quietly… And nothing else happened"
+        streamed, flushed = self.stream_characters(text, tokenizer="nupunkt")
+        self.assertEqual(streamed, ["He paused for a long time…", "Then he left the room quietly…"])
+        self.assertEqual(flushed, ["And nothing else happened"])
+
+    @unittest.skipUnless(importlib.util.find_spec("nupunkt"), "nupunkt is not installed")
+    def test_stream_after_tokenizer_switch(self):
+        # The tokenizer is module wide, so the nltk splitter ends up
+        # tokenizing with nupunkt once the second splitter is created
+        text = "He paused for a long time… Then he left the room quietly… And nothing else happened"
+        splitter = SentenceSplitter(tokenizer="nltk")
+        SentenceSplitter(tokenizer="nupunkt")
+        streamed = []
+        for char in text:
+            splitter.add(char)
+            streamed.extend(splitter.stream())
+        self.assertEqual(streamed, ["He paused for a long time…", "Then he left the room quietly…"])
+        self.assertEqual(list(splitter.flush()), ["And nothing else happened"])
+
     def test_tricky_sentence1(self):
         text = "Good muffins cost $3.88 in New York. Please buy me two of them."
         expected = ["Good muffins cost $3.88 in New York.", "Please buy me two of them."]
@@ -126,6 +202,18 @@ class TestSentenceGenerator(unittest.TestCase):
         sentences = list(generate_sentences(text, cleanup_text_links=True, cleanup_text_emojis=True))
         self.assertEqual(sentences, expected)
 
+    def test_cleanup_emojis(self):
+        text = "Alarm ⏰ ⌛ ⬛ ⬆️ 🅰 🈁 🀄 ‼ ©️ ®️ keycap 1️⃣ family 👨‍👩‍👧 thumbs 👍🏽 flag 🇩🇪 play ▶️ info ℹ️ tm ™️ england 🏴\U000E0067\U000E0062\U000E0065\U000E006E\U000E0067\U000E007F tile 🀀 done ✓ ❶" 
+        expected = ["Alarm           keycap  family  thumbs  flag  play  info  tm  england  tile 🀀 done ✓ ❶"]
+        sentences = list(generate_sentences(text, cleanup_text_emojis=True))
+        self.assertEqual(sentences, expected)
+
+    def test_cleanup_strict_emoji(self):
+        text = "Text with link: https://www.example.com and emoji 😀" 
+        expected = ["Text with link:  and emoji"]
+        sentences = list(generate_sentences(text, cleanup_text_links=True, cleanup_text_emojis=True, strict_emoji=True))
+        self.assertEqual(sentences, expected)
+
     def test_check1(self):
         text = "I'll go with a glass of red wine. Thank you." 
         expected = ["I'll go with a glass of red wine.", "Thank you."]